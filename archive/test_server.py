@@ -1,56 +1,105 @@
 #!/usr/bin/env python3
 """
-Simple test script to verify the MCP server responds correctly.
-Sends a simple MCP initialize request to the server.
+Throughput probe for the MCP server over the stdio transport.
+Starts the server as a subprocess, initializes a session, then pipelines N
+tools/list + tools/call requests concurrently and matches responses by id.
+
+Usage (from the repository root):
+    python archive/test_server.py [N]
+
+tools/call runs search_schema, so without a reachable EBX backend those calls
+return tool errors; they still exercise the full request/response path.
 """
 
-import subprocess
-import json
+import asyncio
+import itertools
 import sys
+import time
+from pathlib import Path
+
+import orjson
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TIMEOUT = 30
+
+ids = itertools.count()
+pending = {}
+
+
+async def read_responses(stdout):
+    """Resolve the pending request future for every response line the server writes."""
+    while line := await stdout.readline():
+        message = orjson.loads(line)
+        future = pending.pop(message.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(message)
+
 
-# Start the server process
-process = subprocess.Popen(
-    [sys.executable, 'server.py'],
-    stdin=subprocess.PIPE,
-    stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE,
-    text=True,
-    bufsize=0
-)
-
-# Send an initialize request (MCP protocol)
-initialize_request = {
-    "jsonrpc": "2.0",
-    "id": 1,
-    "method": "initialize",
-    "params": {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {},
-        "clientInfo": {
-            "name": "test-client",
-            "version": "1.0.0"
-        }
-    }
-}
-
-try:
-    # Send the request
-    print("Sending initialize request...")
-    process.stdin.write(json.dumps(initialize_request) + '\n')
-    process.stdin.flush()
-    
-    # Read response (with timeout)
-    import select
-    if select.select([process.stdout], [], [], 5)[0]:
-        response = process.stdout.readline()
-        print("Server response:")
-        print(json.dumps(json.loads(response), indent=2))
-        print("\n✅ Server is working correctly!")
-    else:
+async def send_and_recv(stdin, method, params=None):
+    """Write one JSON-RPC request and wait for the response with the same id."""
+    request_id = next(ids)
+    future = asyncio.get_running_loop().create_future()
+    pending[request_id] = future
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        request["params"] = params
+    stdin.write(orjson.dumps(request) + b"\n")
+    await stdin.drain()
+    return await future
+
+
+async def main(n):
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "from server import mcp; mcp.run(show_banner=False)",
+        cwd=REPO_ROOT,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    reader = asyncio.create_task(read_responses(process.stdout))
+
+    try:
+        print("Sending initialize request...")
+        response = await asyncio.wait_for(send_and_recv(process.stdin, "initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "test-client",
+                "version": "1.0.0"
+            }
+        }), TIMEOUT)
+        print(f"Server: {response['result']['serverInfo']['name']}")
+        process.stdin.write(orjson.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + b"\n")
+        await process.stdin.drain()
+
+        print(f"Pipelining {n} tools/list + {n} tools/call requests...")
+        requests = []
+        for i in range(n):
+            requests.append(send_and_recv(process.stdin, "tools/list"))
+            requests.append(send_and_recv(process.stdin, "tools/call", {
+                "name": "search_schema",
+                "arguments": {"query": f"probe-{i}"}
+            }))
+        start = time.perf_counter()
+        responses = await asyncio.wait_for(asyncio.gather(*requests), TIMEOUT)
+        elapsed = time.perf_counter() - start
+
+        failed = [r for r in responses if "error" in r]
+        print(f"{len(responses)} responses in {elapsed:.3f}s ({len(responses) / elapsed:.0f} req/s)")
+        if failed:
+            print(f"⚠️  {len(failed)} JSON-RPC errors, first: {failed[0]['error']}")
+        else:
+            print("\n✅ Server is working correctly!")
+
+    except asyncio.TimeoutError:
         print("⚠️  No response from server (timeout)")
-        
-except Exception as e:
-    print(f"❌ Error: {e}")
-finally:
-    process.terminate()
-    process.wait()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    finally:
+        reader.cancel()
+        process.terminate()
+        await process.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
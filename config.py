@@ -0,0 +1,20 @@
+import base64
+import os
+
+# Base URL for the EBX Agent API
+BASE_URL = "http://localhost:8081/ebx-ps-fasttrack/rest"
+
+# Basic authentication credentials
+AUTH = ("admin", "admin")
+
+# Authorization header encoded once and sent as a default header on every EBX request
+AUTH_HEADER = "Basic " + base64.b64encode(f"{AUTH[0]}:{AUTH[1]}".encode()).decode()
+
+# Unix domain socket of the EBX server when it runs on the same host (e.g. "/tmp/ebx.sock").
+# When set, requests go over the socket instead of TCP loopback; BASE_URL still
+# provides the path and Host header.
+EBX_UDS = os.environ.get("EBX_UDS")
+
+# Register the find_similar_records tool; set EBX_VECTORS=0 for EBX deployments
+# without the vector-similarity endpoint
+EBX_VECTORS = os.environ.get("EBX_VECTORS", "1") == "1"
@@ -1,24 +1,188 @@
 #!/usr/bin/env python3
+import asyncio
+import inspect
 import logging
-from urllib import response
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
 import httpx
+import msgspec
+import orjson
 from fastmcp import FastMCP
-from fastapi import FastAPI
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware.dereference import DereferenceRefsMiddleware
 import uvicorn
-from typing import Optional, List, Dict
+from uvicorn.config import LOG_LEVELS
+from pydantic import BaseModel
+from typing import Any, Optional, List, Dict, get_type_hints
 
-logging.basicConfig(level=logging.DEBUG)
+from config import AUTH_HEADER, BASE_URL, EBX_UDS, EBX_VECTORS
 
-# Base URL for the EBX Agent API
-BASE_URL = "http://localhost:8081/ebx-ps-fasttrack/rest"
+# One level for both our loggers and uvicorn's, checked against uvicorn's level names
+# (plus the logging module's WARN and FATAL aliases) so a typo fails at startup
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").lower()
+LOG_LEVEL = {"warn": "warning", "fatal": "critical"}.get(LOG_LEVEL, LOG_LEVEL)
+if LOG_LEVEL not in LOG_LEVELS:
+    raise SystemExit(
+        f"Invalid LOG_LEVEL {os.environ['LOG_LEVEL']!r}; expected one of: {', '.join(LOG_LEVELS)}"
+    )
+logging.basicConfig(level=LOG_LEVELS[LOG_LEVEL])
 
-# Basic authentication credentials
-AUTH = ("admin", "admin")
+# Per-request/per-frame logging from the HTTP client stack is too chatty to leave on
+for noisy_logger in ("httpx", "httpcore", "hpack", "h2"):
+    logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
+# Upper bound for the k argument of find_similar_records
+MAX_SIMILAR_RECORDS = 100
+
+# Shared client for all EBX calls, opened and closed by the app lifespan so
+# connections to the backend are kept alive between tool calls
+http_client: Optional[httpx.AsyncClient] = None
+
+def _ebx_error(response: httpx.Response, label: str = "EBX SQL Error") -> ToolError:
+    """Build the tool error for a failed EBX response, preferring the Java API's JSON details."""
+    try:
+        error_data = orjson.loads(response.content)
+        return ToolError(f"{label}: {error_data.get('details', 'Unknown error')}")
+    except Exception:
+        # Fallback if the response isn't valid JSON
+        return ToolError(f"HTTP Error {response.status_code}: {response.text}")
+
+# Cleared the first time the backend has no /agent/v1/fields:batch endpoint,
+# after which get_table_definitions goes straight to per-table requests
+fields_batch_supported = True
+
+# Schema metadata changes rarely, so search_schema and get_table_definition
+# results are cached in-process for a few minutes, keyed on their arguments
+SCHEMA_CACHE_TTL = 300  # seconds
+SCHEMA_CACHE_MAXSIZE = 1024
+SCHEMA_CACHE_LOG_EVERY = 100  # lookups between hit-rate log lines
+
+schema_cache: Dict[tuple, tuple] = {}  # key -> (expires_at, value)
+schema_cache_stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+# Upstream fetches currently in flight, so concurrent identical lookups share
+# one EBX request instead of each issuing their own
+schema_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Bumped by invalidate_schema_cache so fetches started before it don't re-store stale results
+schema_cache_generation = 0
+
+logger = logging.getLogger(__name__)
+
+async def _fetch_and_store(key: tuple, fetch) -> str:
+    """Call fetch() and cache its result; errors raise and are never cached."""
+    generation = schema_cache_generation
+    value = await fetch()
+    if generation != schema_cache_generation:
+        return value  # the cache was invalidated while this fetch was in flight
+    schema_cache.pop(key, None)
+    if len(schema_cache) >= SCHEMA_CACHE_MAXSIZE:
+        schema_cache.pop(next(iter(schema_cache)))  # evict the oldest entry
+    schema_cache[key] = (time.monotonic() + SCHEMA_CACHE_TTL, value)
+    return value
+
+def _schema_lookup(key: tuple, fetch) -> tuple:
+    """Resolve key from the cache, an in-flight request or a new upstream fetch().
+    
+    Returns a future for the result and whether this lookup started the fetch.
+    """
+    started = False
+    entry = schema_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        schema_cache_stats["hits"] += 1
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(entry[1])
+    else:
+        future = schema_inflight.get(key)
+        if future is None:
+            schema_cache_stats["misses"] += 1
+            future = asyncio.ensure_future(_fetch_and_store(key, fetch))
+            schema_inflight[key] = future
+            future.add_done_callback(
+                lambda done: schema_inflight.pop(key) if schema_inflight.get(key) is done else None
+            )
+            started = True
+        else:
+            schema_cache_stats["coalesced"] += 1
+
+    lookups = sum(schema_cache_stats.values())
+    if lookups % SCHEMA_CACHE_LOG_EVERY == 0:
+        logger.info(
+            "Schema cache: %d hits, %d coalesced, %d misses (%.0f%% hit rate), %d entries",
+            schema_cache_stats["hits"], schema_cache_stats["coalesced"], schema_cache_stats["misses"],
+            100 * (schema_cache_stats["hits"] + schema_cache_stats["coalesced"]) / lookups, len(schema_cache)
+        )
+    return future, started
+
+async def _cached(key: tuple, fetch) -> str:
+    """Return the cached result for key, calling fetch() on a miss or after expiry.
+    
+    Lookups go cache -> in-flight request -> new upstream request.
+    """
+    future, _ = _schema_lookup(key, fetch)
+    # Shielded so one caller being cancelled doesn't cancel the fetch for the others
+    return await asyncio.shield(future)
+
+class CachedToolsFastMCP(FastMCP):
+    """FastMCP server that answers tools/list from a result built on first use.
+    
+    The tool set is fixed once the module is imported, so the manifest (including the
+    multi-kilobyte execute_sql description) is assembled once per process instead of
+    on every MCP session.
+    """
+    _tools_manifest = None
+
+    def _manifest_is_shared(self) -> bool:
+        """Whether every session sees the same tools/list result.
+        
+        Nothing in this server filters tools per request (no auth provider, no per-tool auth,
+        no session visibility changes), so the first result can be reused for everyone.
+        An auth provider or custom middleware could hide tools per caller, in which case
+        the manifest is rebuilt on every request as FastMCP normally does.
+        """
+        return self.auth is None and all(
+            isinstance(middleware, DereferenceRefsMiddleware) for middleware in self.middleware
+        )
+
+    async def _on_list_tools(self, ctx, params):
+        if (params is not None and params.cursor) or not self._manifest_is_shared():
+            return await super()._on_list_tools(ctx, params)
+        if self._tools_manifest is None:
+            self._tools_manifest = await super()._on_list_tools(ctx, params)
+        return self._tools_manifest
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Keep one EBX client open for the server's lifetime."""
+    global http_client
+    transport = httpx.AsyncHTTPTransport(
+        uds=EBX_UDS,
+        # httpx negotiates h2 via TLS ALPN and multiplexes concurrent calls over one
+        # connection; plain http:// backends and sockets stay on HTTP/1.1, one request
+        # per connection, so the pool must be large enough for batch/fan-out bursts
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+        http2=True
+    )
+    http_client = httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"Authorization": AUTH_HEADER, "Accept": "application/json"},
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=5.0)
+        # No explicit Accept-Encoding: httpx advertises every decoder it has
+        # (gzip and deflate, plus br and zstd via the brotli/zstd extras) and
+        # decompresses responses transparently
+    )
+    try:
+        yield
+    finally:
+        await http_client.aclose()
 
 # Create FastMCP server instance
-mcp = FastMCP("EBX Agent MCP Server")
+mcp = CachedToolsFastMCP("EBX Agent MCP Server", lifespan=lifespan)
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 async def search_schema(query: str) -> str:
     """Search the EBX schema to discover where data is stored in the repository.
     
@@ -47,16 +211,17 @@ async def search_schema(query: str) -> str:
     Returns:
         JSON array of matching table locations with dataspace, dataset, path, label, and description
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/agent/v1/search",
-            params={"query": query},
-            auth=AUTH
+    async def fetch():
+        response = await http_client.get(
+            "/agent/v1/search",
+            params={"query": query}
         )
         response.raise_for_status()
         return response.text
 
-@mcp.tool()
+    return await _cached(("search_schema", query), fetch)
+
+@mcp.tool(output_schema=None)
 async def execute_sql(sql: str, dataspace: str, dataset: str, additional_datasets: Optional[List[Dict[str, str]]] = None) -> str:
     """Execute a SQL query against the EBX data repository.
     
@@ -158,22 +323,24 @@ sql: SQL SELECT query to execute. Remember to double-quote all field paths and t
     if additional_datasets:
         payload["additional_datasets"] = additional_datasets
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/agent/v1/sql",
-            json=payload,
-            auth=AUTH
-        )
+    async with http_client.stream(
+        "POST",
+        "/agent/v1/sql",
+        json=payload
+    ) as response:
 
         if response.is_error:
-            try:
-                error_data = response.json()
-                return f"EBX SQL Error: {error_data.get('details', 'Unknown error')}"
-            except Exception:
-                return f"HTTP Error {response.status_code}: {response.text}" 
-            
-        return response.text
-@mcp.tool()
+            await response.aread()
+            raise _ebx_error(response)
+
+        # Result sets can be large: grow a single buffer from the (decompressed) chunks
+        # rather than letting httpx keep every chunk and then join them into a copy
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+
+    return body.decode()
+
 async def find_similar_records(dataspace: str, dataset: str, table_path: str, record_pk: str, k: int = 5) -> str:
     """Performs a Top-K Vector Similarity Search by comparing a target record's stored vector embedding against all other records in the same EBX table. Returns the most semantically similar records ranked by cosine similarity score.
 
@@ -194,7 +361,7 @@ async def find_similar_records(dataspace: str, dataset: str, table_path: str, re
         dataset: The name of the EBX dataset containing the table (e.g. "MIMA")
         table_path: The absolute schema path to the table (e.g. "/root/Company")
         record_pk: The primary key of the target record to compare against all others (e.g. "1")
-        k: The number of top similar records to return (default: 5)
+        k: The number of top similar records to return (default: 5, maximum: 100)
 
     Returns:
         A JSON array of up to k objects, sorted by descending similarity score. Each object contains:
@@ -208,29 +375,49 @@ async def find_similar_records(dataspace: str, dataset: str, table_path: str, re
           { "pk": "12", "score": 76.30 }
         ]
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/agent/v1/vector-similarity",
-            json={
-                "dataspace": dataspace,
-                "dataset": dataset,
-                "tablePath": table_path,
-                "recordPk": record_pk,
-                "k": k
-            },
-            auth=AUTH
-        )
+    # Keep agents from asking the backend to rank and return huge result lists
+    k = max(1, min(int(k), MAX_SIMILAR_RECORDS))
 
-        if response.is_error:
-            try:
-                error_data = response.json()
-                return f"EBX Vector Similarity Error: {error_data.get('details', 'Unknown error')}"
-            except Exception:
-                return f"HTTP Error {response.status_code}: {response.text}"
+    response = await http_client.post(
+        "/agent/v1/vector-similarity",
+        json={
+            "dataspace": dataspace,
+            "dataset": dataset,
+            "tablePath": table_path,
+            "recordPk": record_pk,
+            "k": k
+        },
+        # Only pk/score are needed; the top-K header lets proxies key on k
+        headers={"Prefer": "return=minimal", "X-Top-K": str(k)}
+    )
 
-        return response.text
+    if response.is_error:
+        raise _ebx_error(response, "EBX Vector Similarity Error")
+
+    return response.text
+
+# Only EBX deployments with the vector-similarity endpoint get this tool
+if EBX_VECTORS:
+    mcp.tool(output_schema=None)(find_similar_records)
+
+async def _fetch_table_definition(dataspace: str, dataset: str, path: str) -> str:
+    """Fetch one table's field definitions from EBX, bypassing the schema cache."""
+    response = await http_client.get(
+        "/agent/v1/fields",
+        params={
+            "dataspace": dataspace,
+            "dataset": dataset,
+            "path": path
+        }
+    )
+
+    # Check if the Java API returned an error (400 or 500)
+    if response.is_error:
+        raise _ebx_error(response)
+
+    return response.text
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 async def get_table_definition(dataspace: str, dataset: str, path: str) -> str:
     """Get detailed field information for a specific table in EBX.
     
@@ -264,33 +451,260 @@ async def get_table_definition(dataspace: str, dataset: str, path: str) -> str:
     Returns:
         JSON array of field definitions with name, label, type, and fk_target (null if not a FK)
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/agent/v1/fields",
-            params={
-                "dataspace": dataspace,
-                "dataset": dataset,
-                "path": path
-            },
-            auth=AUTH
+    return await _cached(
+        ("get_table_definition", dataspace, dataset, path),
+        lambda: _fetch_table_definition(dataspace, dataset, path)
+    )
+
+class TableRef(BaseModel):
+    """Location of an EBX table, as returned by search_schema."""
+    dataspace: str
+    dataset: str
+    path: str
+
+async def _fetch_table_definitions(tables: List[TableRef]) -> List[Any]:
+    """Fetch several tables' field definitions, returning each table's JSON text or its error."""
+    global fields_batch_supported
+
+    if fields_batch_supported:
+        response = await http_client.post(
+            "/agent/v1/fields:batch",
+            json=[table.model_dump() for table in tables]
         )
+        if response.status_code in (404, 405):
+            fields_batch_supported = False
+        elif response.is_error:
+            return [_ebx_error(response) for _ in tables]
+        else:
+            definitions = orjson.loads(response.content)
+            if len(definitions) != len(tables):
+                raise ToolError(f"EBX returned {len(definitions)} field lists for {len(tables)} tables")
+            return [orjson.dumps(definition).decode() for definition in definitions]
 
-        # Check if the Java API returned an error (400 or 500)
-        if response.is_error:
-            try:
-                # Try to return the detailed JSON error from your Java API
-                error_data = response.json()
-                return f"EBX SQL Error: {error_data.get('details', 'Unknown error')}"
-            except Exception:
-                # Fallback if the response isn't valid JSON
-                return f"HTTP Error {response.status_code}: {response.text}" 
-            
-        return response.text
+    # Fallback: one request per table, all in flight at once on the shared client
+    return await asyncio.gather(
+        *[_fetch_table_definition(table.dataspace, table.dataset, table.path) for table in tables],
+        return_exceptions=True
+    )
+
+@mcp.tool(output_schema=None)
+async def get_table_definitions(tables: List[TableRef]) -> str:
+    """Get field information for several EBX tables in one call.
+    
+    Same as get_table_definition, but for a list of tables. Prefer this over repeated
+    get_table_definition calls when you need the fields of more than one table
+    (for example every table returned by search_schema).
+    
+    Args:
+        tables: List of objects with 'dataspace', 'dataset' and 'path' (from search_schema results)
+    
+    Returns:
+        JSON array with one entry per requested table, in request order. Each entry is the
+        table's array of field definitions (as returned by get_table_definition), or an
+        object with an 'error' message if that table could not be read
+    """
+    requested: List[TableRef] = []
+    batch_fetch: Optional[asyncio.Future] = None
+
+    def from_batch(index: int):
+        async def fetch():
+            result = (await batch_fetch)[index]
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        return fetch
+
+    # Cached and in-flight tables are reused; the rest share one upstream fetch
+    lookups = []
+    for table in tables:
+        future, started = _schema_lookup(
+            ("get_table_definition", table.dataspace, table.dataset, table.path),
+            from_batch(len(requested))
+        )
+        if started:
+            requested.append(table)
+        lookups.append(future)
+
+    if requested:
+        # Runs in its own task (started before any fetch() above awaits it), so cancelling
+        # this call doesn't cancel the fetch for other callers that joined one of its tables
+        batch_fetch = asyncio.ensure_future(_fetch_table_definitions(requested))
+
+    results = await asyncio.gather(*[asyncio.shield(future) for future in lookups], return_exceptions=True)
+
+    # Splice the per-table JSON bodies into one array instead of parsing and re-encoding them
+    return "[" + ",".join(
+        orjson.dumps({"error": str(result)}).decode() if isinstance(result, BaseException) else result
+        for result in results
+    ) + "]"
+
+@mcp.tool(output_schema=None)
+async def invalidate_schema_cache() -> str:
+    """Clear the cached search_schema and get_table_definition results.
+    
+    Schema lookups are cached for a few minutes. Call this only when the user says the
+    EBX schema has just changed (e.g. a table or field was added) and fresh results are needed.
+    
+    Returns:
+        Confirmation message with the number of cache entries removed
+    """
+    global schema_cache_generation
+    removed = len(schema_cache)
+    schema_cache_generation += 1
+    schema_cache.clear()
+    # Lookups from now on start fresh fetches instead of joining ones begun before the change
+    schema_inflight.clear()
+    return f"Schema cache cleared ({removed} entries removed)"
+
+class BatchCall(BaseModel):
+    """A single tool invocation inside a batch request."""
+    call_id: int
+    tool: str
+    params: Dict[str, Any] = {}
+    input_from: int = -1
+
+def _args_struct(fn) -> type:
+    """Build a msgspec struct with the same parameters as a tool function."""
+    hints = get_type_hints(fn)
+    fields = [
+        (name, hints[name]) if param.default is inspect.Parameter.empty
+        else (name, hints[name], param.default)
+        for name, param in inspect.signature(fn).parameters.items()
+    ]
+    return msgspec.defstruct(f"{fn.__name__}_args", fields, forbid_unknown_fields=True)
+
+# Tools that can be invoked from a batch, called directly rather than through MCP
+# (FastMCP 4 leaves @mcp.tool() functions callable as plain coroutines). Batch params
+# skip FastMCP's own validation, so they are checked against msgspec structs generated
+# from each tool's signature, which is cheaper than pydantic and cannot drift from it
+BATCH_TOOLS = {
+    name: (fn, _args_struct(fn))
+    for name, fn in (
+        ("search_schema", search_schema),
+        ("get_table_definition", get_table_definition),
+        ("execute_sql", execute_sql),
+    )
+}
+
+# Location fields copied from an upstream result into a dependent call's params
+FORWARDED_FIELDS = ("dataspace", "dataset", "path")
+
+def _forwarded_params(args_type, params: Dict[str, Any], upstream: Any) -> Dict[str, Any]:
+    """Fill location params the call did not set from the first upstream result row."""
+    row = upstream[0] if isinstance(upstream, list) and upstream else upstream
+    if not isinstance(row, dict):
+        return params
+    accepted = args_type.__struct_fields__
+    forwarded = {
+        name: row[name]
+        for name in FORWARDED_FIELDS
+        if name in accepted and name not in params and name in row
+    }
+    return {**forwarded, **params}
+
+async def _dispatch(call: BatchCall, upstream: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run one batch call and wrap its outcome with a status."""
+    outcome = {"call_id": call.call_id, "tool": call.tool}
+
+    if upstream is not None and upstream["status"] != "OK":
+        return {**outcome, "status": "INVALID_ARGUMENT", "error": f"Input call {call.input_from} did not succeed"}
+
+    if call.tool not in BATCH_TOOLS:
+        return {**outcome, "status": "INVALID_ARGUMENT", "error": f"Unknown tool: {call.tool}"}
+    fn, args_type = BATCH_TOOLS[call.tool]
+
+    params = call.params
+    if upstream is not None:
+        params = _forwarded_params(args_type, params, upstream["result"])
+    try:
+        params = msgspec.structs.asdict(msgspec.convert(params, type=args_type))
+    except msgspec.ValidationError as e:
+        return {**outcome, "status": "INVALID_ARGUMENT", "error": str(e)}
+
+    try:
+        # Parsed here so a sub-call with a non-JSON body fails on its own, not the whole batch
+        result = orjson.loads(await fn(**params))
+    except Exception as e:
+        return {**outcome, "status": "ERROR", "error": str(e)}
+
+    return {**outcome, "status": "OK", "result": result}
+
+@mcp.tool(output_schema=None)
+async def batch(calls: List[BatchCall]) -> str:
+    """Run several EBX tool calls in a single request.
+    
+    Use this to chain discovery steps (search_schema -> get_table_definition -> execute_sql)
+    without a separate round trip for each step. Calls that do not depend on each other
+    run concurrently.
+    
+    Each call has:
+    - call_id: Unique number identifying the call within the batch
+    - tool: One of 'search_schema', 'get_table_definition', 'execute_sql'
+    - params: Arguments for the tool, exactly as when calling it directly
+    - input_from: call_id of an earlier call whose result feeds this one (default -1, no input)
+    
+    Input forwarding:
+    - When input_from is set, the call runs after that call completes
+    - dataspace, dataset and path missing from params are taken from the first row of the
+      input call's result (e.g. the first table returned by search_schema)
+    - Values given explicitly in params always take precedence
+    - If the input call fails, this call (and anything depending on it) is skipped
+      with status INVALID_ARGUMENT
+    
+    Example:
+      calls=[
+        {"call_id": 1, "tool": "search_schema", "params": {"query": "customer"}},
+        {"call_id": 2, "tool": "get_table_definition", "params": {}, "input_from": 1}
+      ]
+    
+    Args:
+        calls: List of tool calls to execute
+    
+    Returns:
+        JSON array with one entry per call, in request order, each with call_id, tool,
+        status ('OK', 'ERROR' or 'INVALID_ARGUMENT') and either result or error
+    """
+    call_ids = [call.call_id for call in calls]
+    if len(set(call_ids)) != len(call_ids):
+        raise ToolError("Batch Error: call_id values must be unique")
+
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    pending = list(calls)
+
+    # Run the calls layer by layer: each layer holds every call whose input is already available
+    while pending:
+        layer = [call for call in pending if call.input_from == -1 or call.input_from in outcomes]
+        if not layer:
+            break
+        pending = [call for call in pending if call not in layer]
+        results = await asyncio.gather(*[_dispatch(call, outcomes.get(call.input_from)) for call in layer])
+        for call, result in zip(layer, results):
+            outcomes[call.call_id] = result
+
+    # Anything left refers to a missing call or is part of a cycle
+    for call in pending:
+        outcomes[call.call_id] = {
+            "call_id": call.call_id,
+            "tool": call.tool,
+            "status": "INVALID_ARGUMENT",
+            "error": f"input_from {call.input_from} does not refer to a call that can run before this one",
+        }
+
+    return orjson.dumps([outcomes[call_id] for call_id in call_ids]).decode()
 
 mcp_app = mcp.http_app(path="/mcp", stateless_http=True)
-app = FastAPI(lifespan=mcp_app.lifespan)  # Use MCP lifespan for startup/shutdown events
-app.mount("/", mcp_app)  
 
 if __name__ == "__main__":
-#    mcp.run(transport="streamable-http", host="0.0.0.0", port=8000)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # One worker by default: the schema cache, its singleflight and invalidate_schema_cache
+    # are per process. The MCP app is stateless, so WEB_CONCURRENCY can add workers, but
+    # each then keeps its own cache and invalidation only clears the worker that got the call.
+    uvicorn.run(
+        "server:mcp_app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        # libuv event loop and C HTTP parser; uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level=LOG_LEVEL
+    )
@@ -1,6 +1,7 @@
 from fastmcp import FastMCP
 import httpx
 import json
+import sys
 
 # 1. Initialize the FastMCP server
 mcp = FastMCP("EBX_SQL_Gateway")
@@ -352,10 +353,6 @@ async def execute_ebx_sql(auth_token: str, sql: str, dataspace: str, dataset: st
     except Exception as e:
         return f"Network or connection error communicating with EBX: {str(e)}"
 
-import httpx
-import json
-import urllib.parse
-
 @mcp.tool()
 async def query_ebx_table(auth_token: str, dataspace: str, dataset: str, table_path: str, filter_xpath: str = None, limit: int = 50) -> str:
     """
@@ -426,4 +423,10 @@ async def query_ebx_table(auth_token: str, dataspace: str, dataset: str, table_p
 
 # 4. Run the server
 if __name__ == "__main__":
-    mcp.run(transport="http", host="0.0.0.0", port=8001)
+    # mcp.run() creates its own event loop, so select uvloop via the loop policy
+    # (uvloop is not available on Windows)
+    if sys.platform != "win32":
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    mcp.run(transport="http", host="0.0.0.0", port=8001, uvicorn_config={"http": "httptools"})